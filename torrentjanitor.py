@@ -12,15 +12,21 @@ Version: 1.0.0
     Keeps your torrent client running smoothly
 """
 
-import json
 import time
 import logging
+import logging.handlers
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
-from datetime import datetime, timedelta
+import functools
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, Collection, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+from dataclasses import dataclass
 from enum import Enum
 import os
 import sys
@@ -28,6 +34,29 @@ import sys
 __version__ = "1.0.0"
 __author__ = "Giovanni Guarino"
 
+# Torrent state groups used by the removal rules
+_ERROR_STATES = frozenset({"error", "missingFiles"})
+_STALLED_STATES = frozenset({"stalledDL", "stalledUP"})
+
+# Statistics group of each qBittorrent torrent state
+STATE_BUCKET = {
+    "downloading": "downloading",
+    "uploading": "seeding",
+    "stalledUP": "seeding",
+    "queuedDL": "queued",
+    "stalledDL": "stalled",
+    "metaDL": "metadl",
+    "error": "error",
+    "missingFiles": "error",
+    "pausedDL": "paused",
+    "pausedUP": "paused"
+}
+
+@functools.lru_cache(maxsize=4096)
+def _tracker_is_private(tracker: str, private_trackers: FrozenSet[str]) -> bool:
+    """Whether a tracker URL should be treated as a private tracker"""
+    return "private" in tracker.lower() or tracker in private_trackers
+
 class RemovalReason(Enum):
     """Reasons for torrent removal"""
     ERROR_STATE = "Error state or missing files"
@@ -40,7 +69,10 @@ class RemovalReason(Enum):
     LOW_RATIO = "Low share ratio"
     SIZE_LIMIT = "Size limit exceeded"
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class TorrentState:
     """Monitored state of a torrent"""
     hash: str
@@ -51,22 +83,196 @@ class TorrentState:
     last_check: float
     size: Optional[int] = None
     progress: Optional[float] = None
+    
+    def to_dict(self) -> Dict:
+        """Serializable representation (cheaper than dataclasses.asdict)"""
+        return {
+            "hash": self.hash,
+            "name": self.name,
+            "count": self.count,
+            "reason": self.reason,
+            "first_seen": self.first_seen,
+            "last_check": self.last_check,
+            "size": self.size,
+            "progress": self.progress
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TorrentState":
+        """Inverse of to_dict, ignoring keys this version doesn't know"""
+        return cls(
+            data["hash"],
+            data["name"],
+            data["count"],
+            data["reason"],
+            data["first_seen"],
+            data["last_check"],
+            data.get("size"),
+            data.get("progress")
+        )
+
+class _Policy(NamedTuple):
+    """Snapshot of the removal thresholds and rules for one cleaning cycle"""
+    max_meta_time: int
+    min_torrent_age: int
+    min_progress_protect: float
+    min_download_speed: int
+    min_seeds_required: int
+    max_queue_time: int
+    max_seed_time: int
+    grace_checks: int
+    use_server_filter: bool
+    remove_errors: bool
+    remove_stalled: bool
+    remove_metadata_timeout: bool
+    remove_no_activity: bool
+    remove_queue_timeout: bool
+    remove_low_ratio: bool
+    protect_seeding: bool
+    protect_private_trackers: bool
+    min_seed_ratio: float
+    max_size_bytes: float
+    protected_set: FrozenSet[str]
+    auto_remove_set: FrozenSet[str]
+    private_trackers_set: FrozenSet[str]
+    candidate_states: FrozenSet[str] = frozenset()
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "_Policy":
+        """Build the policy from the merged configuration"""
+        thresholds = config["thresholds"]
+        rules = config.get("rules", {})
+        categories = config.get("categories", {})
+        
+        policy = cls(
+            max_meta_time=thresholds["max_meta_time"],
+            min_torrent_age=thresholds["min_torrent_age"],
+            min_progress_protect=thresholds["min_progress_protect"],
+            min_download_speed=thresholds.get("min_download_speed", 1024),
+            min_seeds_required=thresholds.get("min_seeds_required", 1),
+            max_queue_time=thresholds["max_queue_time"],
+            max_seed_time=thresholds.get("max_seed_time", 604800),
+            grace_checks=thresholds["grace_checks"],
+            use_server_filter=thresholds.get("use_server_filter", True),
+            remove_errors=rules.get("remove_errors", True),
+            remove_stalled=rules.get("remove_stalled", True),
+            remove_metadata_timeout=rules.get("remove_metadata_timeout", True),
+            remove_no_activity=rules.get("remove_no_activity", True),
+            remove_queue_timeout=rules.get("remove_queue_timeout", True),
+            remove_low_ratio=rules.get("remove_low_ratio", False),
+            protect_seeding=rules.get("protect_seeding", True),
+            protect_private_trackers=rules.get("protect_private_trackers", False),
+            min_seed_ratio=rules.get("min_seed_ratio", 1.0),
+            max_size_bytes=rules.get("max_torrent_size_gb", 0) * 1024 * 1024 * 1024,
+            protected_set=frozenset(categories.get("protected", [])),
+            auto_remove_set=frozenset(categories.get("auto_remove", [])),
+            private_trackers_set=frozenset(categories.get("private_trackers", []))
+        )
+        
+        # States that at least one enabled state-based rule can act on
+        rule_states = (
+            (policy.remove_errors, _ERROR_STATES),
+            (policy.remove_stalled, _STALLED_STATES),
+            (policy.remove_metadata_timeout, {"metaDL"}),
+            (policy.remove_no_activity, {"downloading"}),
+            (policy.remove_queue_timeout, {"queuedDL"}),
+            (policy.remove_low_ratio, {"uploading"})
+        )
+        return policy._replace(candidate_states=frozenset().union(*(
+            states for enabled, states in rule_states if enabled
+        )))
+
+class _TorrentCtx(NamedTuple):
+    """Fields of a torrent used by the removal rules, extracted once per cycle"""
+    hash: str
+    name: str
+    state: str
+    added_on: int
+    num_seeds: int
+    dlspeed: int
+    progress: float
+    category: str
+    tracker: str
+    ratio: float
+    size: int
+    age: float
+    
+    @classmethod
+    def from_torrent(cls, torrent: Dict, current_time: float) -> "_TorrentCtx":
+        """Build the context from a /torrents/info entry"""
+        get = torrent.get
+        added_on = torrent["added_on"]
+        return cls(
+            torrent["hash"],
+            torrent["name"][:100],
+            torrent["state"],
+            added_on,
+            get("num_seeds", 0),
+            get("dlspeed", 0),
+            get("progress", 0),
+            get("category", ""),
+            get("tracker", ""),
+            get("ratio", 0),
+            get("size", 0),
+            current_time - added_on
+        )
 
 class QBittorrentClient:
     """qBittorrent API client"""
     
     def __init__(self, host: str, port: int, username: str, password: str, 
-                 timeout: int = 30, verify_ssl: bool = True):
+                 timeout: int = 30, verify_ssl: bool = True, max_workers: int = 8,
+                 cookie_file: Optional[Path] = None):
         self.base_url = f"http://{host}:{port}/api/v2"
         self.username = username
         self.password = password
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.max_workers = max_workers
+        self.cookie_file = cookie_file
         self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": f"TorrentJanitor/{__version__}",
+            "Accept-Encoding": "gzip"
+        })
+        
+        # Reuse a single keep-alive connection to the qBittorrent host
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=100,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"])
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.authenticated = False
         
+        # Serializes re-logins from parallel requests; the generation
+        # counts successful logins so late threads can tell one happened
+        self._auth_lock = threading.Lock()
+        self._auth_generation = 0
+        
+        # Incremental sync/maindata state: response id and hash -> state
+        self._sync_rid = 0
+        self._sync_states: Dict[str, str] = {}
+        
+        self._load_cookies()
+        
     def login(self) -> bool:
-        """Authenticate with qBittorrent"""
+        """Authenticate with qBittorrent, reusing a saved session if still valid"""
+        if self.session.cookies:
+            if self._probe():
+                self.authenticated = True
+                self._auth_generation += 1
+                logging.info("✓ Reusing saved qBittorrent session")
+                return True
+            self.session.cookies.clear()
+        
         try:
             response = self.session.post(
                 f"{self.base_url}/auth/login",
@@ -77,7 +283,9 @@ class QBittorrentClient:
             
             if response.status_code == 200:
                 self.authenticated = True
+                self._auth_generation += 1
                 logging.info("✓ Successfully authenticated with qBittorrent")
+                self._save_cookies()
                 return True
             else:
                 logging.error(f"Authentication failed: HTTP {response.status_code}")
@@ -87,12 +295,81 @@ class QBittorrentClient:
             logging.error(f"Connection error: {e}")
             return False
     
+    def _ensure_authenticated(self) -> bool:
+        """Log in if needed, letting only one thread do so at a time"""
+        if self.authenticated:
+            return True
+        
+        with self._auth_lock:
+            return self.authenticated or self.login()
+    
+    def _probe(self) -> bool:
+        """Check whether the current session cookie is still accepted"""
+        try:
+            response = self.session.get(
+                f"{self.base_url}/app/version",
+                timeout=self.timeout,
+                verify=self.verify_ssl
+            )
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
+    
+    def _load_cookies(self):
+        """Restore the session cookie saved by a previous run"""
+        if not self.cookie_file or not self.cookie_file.exists():
+            return
+        
+        try:
+            with open(self.cookie_file, 'rb') as f:
+                self.session.cookies.update(orjson.loads(f.read()))
+        except Exception as e:
+            logging.warning(f"Could not load saved session: {e}")
+    
+    def _save_cookies(self):
+        """Save the session cookie so restarts can skip the login"""
+        if not self.cookie_file:
+            return
+        
+        try:
+            cookies = requests.utils.dict_from_cookiejar(self.session.cookies)
+            
+            # Private from creation, and atomic for the healthcheck process
+            # which may read or write the same file
+            tmp_file = self.cookie_file.with_name(
+                f"{self.cookie_file.name}.{os.getpid()}.tmp"
+            )
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(cookies))
+            os.replace(tmp_file, self.cookie_file)
+        except Exception as e:
+            logging.warning(f"Could not save session: {e}")
+    
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send an API request, logging in again once if the session expired"""
+        url = f"{self.base_url}{endpoint}"
+        generation = self._auth_generation
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        
+        if response.status_code == 403:
+            with self._auth_lock:
+                # Another thread may already have logged in again
+                if self._auth_generation == generation:
+                    self.authenticated = False
+                    self.session.cookies.clear()
+                    self.login()
+            
+            if self._auth_generation != generation:
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        
+        return response
+    
     def get_torrents(self, filter: Optional[str] = None, 
                     category: Optional[str] = None) -> Optional[List[Dict]]:
         """Get list of torrents with optional filtering"""
-        if not self.authenticated:
-            if not self.login():
-                return None
+        if not self._ensure_authenticated():
+            return None
         
         try:
             params = {}
@@ -101,44 +378,101 @@ class QBittorrentClient:
             if category:
                 params['category'] = category
                 
-            response = self.session.get(
-                f"{self.base_url}/torrents/info",
-                params=params,
-                timeout=self.timeout
+            response = self._request(
+                "GET", "/torrents/info",
+                params=params
             )
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logging.error(f"Failed to get torrents: HTTP {response.status_code}")
                 return None
                 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logging.error(f"API error: {e}")
             self.authenticated = False
             return None
     
+    def get_torrents_matching(self, filters: Iterable[str] = (), 
+                              categories: Iterable[str] = ()) -> Optional[List[Dict]]:
+        """Get the union of several server-side filtered torrent lists"""
+        if not self._ensure_authenticated():
+            return None
+        
+        queries = [(f, None) for f in filters] + [(None, c) for c in categories]
+        results = self._fan_out(lambda query: self.get_torrents(*query), queries)
+        if any(result is None for result in results):
+            return None
+        
+        # A torrent can match several queries, keep one copy per hash
+        merged = {}
+        for result in results:
+            for torrent in result:
+                merged[torrent["hash"]] = torrent
+        return list(merged.values())
+    
+    def get_torrent_states(self) -> Optional[Dict[str, str]]:
+        """Get the state of every torrent, fetching only changes since the last call"""
+        if not self._ensure_authenticated():
+            return None
+        
+        try:
+            response = self._request(
+                "GET", "/sync/maindata",
+                params={"rid": self._sync_rid}
+            )
+            
+            if response.status_code != 200:
+                logging.error(f"Failed to sync torrents: HTTP {response.status_code}")
+                return None
+            
+            data = orjson.loads(response.content)
+            if data.get("full_update"):
+                self._sync_states = {}
+            for hash_val, changes in data.get("torrents", {}).items():
+                if "state" in changes:
+                    self._sync_states[hash_val] = changes["state"]
+            for hash_val in data.get("torrents_removed", []):
+                self._sync_states.pop(hash_val, None)
+            
+            self._sync_rid = data.get("rid", 0)
+            return self._sync_states
+            
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logging.error(f"API error: {e}")
+            self.authenticated = False
+            self._sync_rid = 0
+            return None
+    
     def get_torrent_properties(self, hash: str) -> Optional[Dict]:
         """Get detailed properties of a specific torrent"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/torrents/properties",
-                params={"hash": hash},
-                timeout=self.timeout
+            response = self._request(
+                "GET", "/torrents/properties",
+                params={"hash": hash}
             )
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
         except:
             pass
         return None
     
+    def _fan_out(self, func: Callable, items: Iterable) -> List:
+        """Run an API call for each item in parallel over the shared session"""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(func, items))
+    
     def reannounce(self, hashes: List[str]) -> bool:
         """Reannounce torrents to trackers"""
         try:
-            response = self.session.post(
-                f"{self.base_url}/torrents/reannounce",
-                data={"hashes": "|".join(hashes)},
-                timeout=self.timeout
+            response = self._request(
+                "POST", "/torrents/reannounce",
+                data={"hashes": "|".join(hashes)}
             )
             return response.status_code in [200, 204]
         except:
@@ -152,13 +486,12 @@ class QBittorrentClient:
             return True
             
         try:
-            response = self.session.post(
-                f"{self.base_url}/torrents/delete",
+            response = self._request(
+                "POST", "/torrents/delete",
                 data={
                     "hashes": "|".join(hashes),
                     "deleteFiles": str(delete_files).lower()
-                },
-                timeout=self.timeout
+                }
             )
             return response.status_code in [200, 204]
         except requests.RequestException as e:
@@ -168,10 +501,9 @@ class QBittorrentClient:
     def pause_torrents(self, hashes: List[str]) -> bool:
         """Pause torrents"""
         try:
-            response = self.session.post(
-                f"{self.base_url}/torrents/pause",
-                data={"hashes": "|".join(hashes)},
-                timeout=self.timeout
+            response = self._request(
+                "POST", "/torrents/pause",
+                data={"hashes": "|".join(hashes)}
             )
             return response.status_code in [200, 204]
         except:
@@ -182,9 +514,6 @@ class TorrentJanitor:
     
     def __init__(self, config: Dict):
         self.config = config
-        self.client = QBittorrentClient(
-            **config["qbittorrent"]
-        )
         
         # Setup directories and files
         self.work_dir = Path(config["paths"]["work_dir"])
@@ -193,12 +522,19 @@ class TorrentJanitor:
         self.state_file = self.work_dir / config["paths"]["state_file"]
         self.log_file = self.work_dir / config["paths"]["log_file"]
         self.stats_file = self.work_dir / config["paths"].get("stats_file", "stats.json")
+        self.cookie_file = self.work_dir / config["paths"].get("cookie_file", "qb_cookies.json")
+        
+        self.client = QBittorrentClient(
+            **config["qbittorrent"],
+            cookie_file=self.cookie_file
+        )
         
         # Setup logging
         self._setup_logging()
         
         # Load state
         self.torrent_states: Dict[str, TorrentState] = self._load_state()
+        self._state_dirty = False
         
         # Statistics
         self.stats = {
@@ -216,17 +552,31 @@ class TorrentJanitor:
                                     '%(asctime)s - %(levelname)s - %(message)s')
         
         # File handler with rotation
-        file_handler = logging.FileHandler(self.log_file)
+        file_handler = logging.handlers.RotatingFileHandler(
+            self.log_file,
+            maxBytes=log_config.get("max_file_size_mb", 10) * 1024 * 1024,
+            backupCount=log_config.get("max_files", 5),
+            encoding="utf-8",
+            delay=True
+        )
         file_handler.setFormatter(logging.Formatter(log_format))
         
+        # Buffer file writes, flushed on warnings and at the end of each cycle
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=200,
+            flushLevel=logging.WARNING,
+            target=file_handler
+        )
+        
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(logging.Formatter(log_format))
         
-        # Configure root logger
+        # Configure root logger (replacing any implicit config from load_config)
         logging.basicConfig(
             level=log_level,
-            handlers=[file_handler, console_handler]
+            handlers=[self._log_buffer, console_handler],
+            force=True
         )
         
         # Log startup
@@ -239,143 +589,147 @@ class TorrentJanitor:
             return {}
         
         try:
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
+            with open(self.state_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 return {
-                    k: TorrentState(**v) for k, v in data.items()
+                    k: TorrentState.from_dict(v) for k, v in data.items()
                 }
         except Exception as e:
             logging.warning(f"Could not load state: {e}")
             return {}
     
     def _save_state(self):
-        """Save persistent state"""
+        """Save persistent state (only when it changed)"""
+        if not self._state_dirty:
+            return
+        
         try:
             data = {
-                k: asdict(v) for k, v in self.torrent_states.items()
+                k: v.to_dict() for k, v in self.torrent_states.items()
             }
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_json(self.state_file, data)
+            self._state_dirty = False
         except Exception as e:
             logging.error(f"Could not save state: {e}")
     
     def _save_stats(self):
         """Save statistics"""
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            self._write_json(self.stats_file, self.stats)
         except:
             pass
     
-    def _should_remove_torrent(self, torrent: Dict) -> Tuple[bool, Optional[RemovalReason]]:
+    def _write_json(self, path: Path, data: Dict):
+        """Atomically write data as JSON, so a crash never leaves a truncated file"""
+        # Per-process name: the healthcheck may write the same files concurrently
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, path)
+    
+    def _forget_state(self, hash_val: str):
+        """Stop monitoring a torrent"""
+        if self.torrent_states.pop(hash_val, None) is not None:
+            self._state_dirty = True
+    
+    def _should_remove_torrent(self, ctx: _TorrentCtx, pol: _Policy, 
+                               current_time: float) -> Tuple[bool, Optional[RemovalReason]]:
         """Determine if a torrent should be removed"""
-        current_time = time.time()
-        thresholds = self.config["thresholds"]
-        rules = self.config.get("rules", {})
-        categories = self.config.get("categories", {})
-        
-        hash_val = torrent["hash"]
-        name = torrent["name"][:100]
-        state = torrent["state"]
-        added_on = torrent["added_on"]
-        num_seeds = torrent.get("num_seeds", 0)
-        dlspeed = torrent.get("dlspeed", 0)
-        progress = torrent.get("progress", 0)
-        category = torrent.get("category", "")
-        tracker = torrent.get("tracker", "")
-        ratio = torrent.get("ratio", 0)
-        size = torrent.get("size", 0)
-        
-        age = current_time - added_on
+        (hash_val, name, state, added_on, num_seeds, dlspeed, progress,
+         category, tracker, ratio, size, age) = ctx
         
         # Protected categories
-        if category in categories.get("protected", []):
-            if hash_val in self.torrent_states:
-                del self.torrent_states[hash_val]
+        if category in pol.protected_set:
+            self._forget_state(hash_val)
             return False, None
         
         # Auto-remove categories
-        if category in categories.get("auto_remove", []):
+        if category in pol.auto_remove_set:
             logging.debug(f"Auto-remove category: {name}")
             return True, RemovalReason.AUTO_CATEGORY
         
         # Protect seeding torrents if configured
-        if rules.get("protect_seeding", True) and state == "uploading":
-            if ratio >= rules.get("min_seed_ratio", 1.0):
+        if pol.protect_seeding and state == "uploading":
+            if ratio >= pol.min_seed_ratio:
                 return False, None
         
         # Protect private trackers if configured
-        if rules.get("protect_private_trackers", False):
-            if "private" in tracker.lower() or tracker in categories.get("private_trackers", []):
+        if pol.protect_private_trackers:
+            if _tracker_is_private(tracker, pol.private_trackers_set):
                 return False, None
         
         # Size limits
-        max_size = rules.get("max_torrent_size_gb", 0) * 1024 * 1024 * 1024
-        if max_size > 0 and size > max_size and progress < 0.1:
+        if pol.max_size_bytes > 0 and size > pol.max_size_bytes and progress < 0.1:
             return True, RemovalReason.SIZE_LIMIT
         
+        # Fast path: an actively downloading torrent matches no rule below
+        if state == "downloading" and dlspeed >= pol.min_download_speed:
+            self._forget_state(hash_val)
+            return False, None
+        
         # 1. Immediate error states
-        if rules.get("remove_errors", True) and state in ["error", "missingFiles"]:
+        if pol.remove_errors and state in _ERROR_STATES:
             logging.debug(f"Error state detected: {name}")
             return True, RemovalReason.ERROR_STATE
         
         # 2. Stalled torrents
-        if rules.get("remove_stalled", True) and state in ["stalledDL", "stalledUP"]:
+        if pol.remove_stalled and state in _STALLED_STATES:
             return self._check_with_grace(
-                hash_val, name, RemovalReason.STALLED, current_time, torrent
+                hash_val, name, RemovalReason.STALLED, current_time, ctx, pol
             )
         
         # 3. Metadata timeout
-        if (rules.get("remove_metadata_timeout", True) and 
-            state == "metaDL" and age > thresholds["max_meta_time"]):
+        if (pol.remove_metadata_timeout and 
+            state == "metaDL" and age > pol.max_meta_time):
             return self._check_with_grace(
-                hash_val, name, RemovalReason.META_TIMEOUT, current_time, torrent
+                hash_val, name, RemovalReason.META_TIMEOUT, current_time, ctx, pol
             )
         
         # 4. No activity downloads
-        if (rules.get("remove_no_activity", True) and
+        if (pol.remove_no_activity and
             state == "downloading" and 
-            dlspeed < thresholds.get("min_download_speed", 1024) and 
-            num_seeds < thresholds.get("min_seeds_required", 1) and
-            progress * 100 <= thresholds["min_progress_protect"] and
-            age > thresholds["min_torrent_age"]):
+            dlspeed < pol.min_download_speed and 
+            num_seeds < pol.min_seeds_required and
+            progress * 100 <= pol.min_progress_protect and
+            age > pol.min_torrent_age):
             return self._check_with_grace(
-                hash_val, name, RemovalReason.NO_ACTIVITY, current_time, torrent
+                hash_val, name, RemovalReason.NO_ACTIVITY, current_time, ctx, pol
             )
         
         # 5. Queue timeout
-        if (rules.get("remove_queue_timeout", True) and
-            state == "queuedDL" and age > thresholds["max_queue_time"]):
+        if (pol.remove_queue_timeout and
+            state == "queuedDL" and age > pol.max_queue_time):
             return self._check_with_grace(
-                hash_val, name, RemovalReason.QUEUE_TIMEOUT, current_time, torrent
+                hash_val, name, RemovalReason.QUEUE_TIMEOUT, current_time, ctx, pol
             )
         
         # 6. Low ratio (completed torrents)
-        if (rules.get("remove_low_ratio", False) and
+        if (pol.remove_low_ratio and
             state == "uploading" and
-            ratio < rules.get("min_seed_ratio", 1.0) and
-            age > thresholds.get("max_seed_time", 604800)):
+            ratio < pol.min_seed_ratio and
+            age > pol.max_seed_time):
             return self._check_with_grace(
-                hash_val, name, RemovalReason.LOW_RATIO, current_time, torrent
+                hash_val, name, RemovalReason.LOW_RATIO, current_time, ctx, pol
             )
         
         # Remove from monitoring if now OK
-        if hash_val in self.torrent_states:
-            del self.torrent_states[hash_val]
+        self._forget_state(hash_val)
         
         return False, None
     
     def _check_with_grace(self, hash_val: str, name: str, reason: RemovalReason, 
-                          current_time: float, torrent: Dict) -> Tuple[bool, Optional[RemovalReason]]:
+                          current_time: float, ctx: _TorrentCtx, 
+                          pol: _Policy) -> Tuple[bool, Optional[RemovalReason]]:
         """Check with grace period before removal"""
-        grace_checks = self.config["thresholds"]["grace_checks"]
+        grace_checks = pol.grace_checks
+        self._state_dirty = True
         
         if hash_val in self.torrent_states:
             state = self.torrent_states[hash_val]
             state.count += 1
             state.last_check = current_time
-            state.size = torrent.get("size", 0)
-            state.progress = torrent.get("progress", 0)
+            state.size = ctx.size
+            state.progress = ctx.progress
             
             if state.count >= grace_checks:
                 logging.info(f"🗑️  Removing after {state.count} checks ({reason.value}): {name}")
@@ -392,8 +746,8 @@ class TorrentJanitor:
                 reason=reason.value,
                 first_seen=current_time,
                 last_check=current_time,
-                size=torrent.get("size", 0),
-                progress=torrent.get("progress", 0)
+                size=ctx.size,
+                progress=ctx.progress
             )
             logging.warning(f"⚠️  Check 1/{grace_checks} for {reason.value}: {name}")
             return False, None
@@ -405,49 +759,43 @@ class TorrentJanitor:
         
         self.stats["checks_performed"] += 1
         
-        torrents = self.client.get_torrents()
-        if not torrents:
-            logging.warning("No torrents found or API error")
+        pol = _Policy.from_config(self.config)
+        torrents = self._fetch_torrents(pol)
+        if torrents is None:
+            logging.warning("Could not fetch torrents, skipping check cycle")
             return
         
+        # Statistics cover every torrent, even those filtered out server-side
+        states = None
+        if pol.use_server_filter:
+            states = self.client.get_torrent_states()
+        if states is None:
+            states = {t["hash"]: t["state"] for t in torrents}
+        stats = self._count_states(states.values())
+        
         # Analyze torrents
+        current_time = time.time()
+        current_hashes = set()
         to_remove = []
-        stats = {
-            "total": len(torrents),
-            "downloading": 0,
-            "seeding": 0,
-            "queued": 0,
-            "stalled": 0,
-            "metadl": 0,
-            "error": 0,
-            "paused": 0
-        }
-        
         for torrent in torrents:
-            # Update statistics
-            state = torrent["state"]
-            if state == "downloading":
-                stats["downloading"] += 1
-            elif state in ["uploading", "stalledUP"]:
-                stats["seeding"] += 1
-            elif state == "queuedDL":
-                stats["queued"] += 1
-            elif state.startswith("stalled"):
-                stats["stalled"] += 1
-            elif state == "metaDL":
-                stats["metadl"] += 1
-            elif state in ["error", "missingFiles"]:
-                stats["error"] += 1
-            elif state in ["pausedDL", "pausedUP"]:
-                stats["paused"] += 1
+            current_hashes.add(torrent["hash"])
+            
+            # Skip torrents no rule can act on without building their context
+            if (torrent["state"] not in pol.candidate_states and
+                    torrent.get("category", "") not in pol.auto_remove_set and
+                    not pol.max_size_bytes and
+                    torrent["hash"] not in self.torrent_states):
+                continue
+            
+            ctx = _TorrentCtx.from_torrent(torrent, current_time)
             
             # Check for removal
-            should_remove, reason = self._should_remove_torrent(torrent)
+            should_remove, reason = self._should_remove_torrent(ctx, pol, current_time)
             if should_remove:
                 to_remove.append({
-                    "hash": torrent["hash"],
-                    "name": torrent["name"][:100],
-                    "size": torrent.get("size", 0),
+                    "hash": ctx.hash,
+                    "name": ctx.name,
+                    "size": ctx.size,
                     "reason": reason
                 })
         
@@ -457,15 +805,40 @@ class TorrentJanitor:
         else:
             logging.info("✅ No torrents to remove")
         
+        # Clean old states before persisting, so they don't linger on disk
+        self._clean_old_states(current_hashes)
+        
         # Save state
         self._save_state()
         self._save_stats()
         
         # Report statistics
         self._report_statistics(stats)
+    
+    def _fetch_torrents(self, pol: _Policy) -> Optional[List[Dict]]:
+        """Fetch the torrents that the enabled rules can act on"""
+        # The size limit applies in any state, so no server filter covers it
+        if not pol.use_server_filter or pol.max_size_bytes > 0:
+            return self.client.get_torrents()
+        
+        # Every downloading-side state (metaDL, stalledDL, queuedDL, ...)
+        filters = ["downloading"]
+        if pol.remove_errors:
+            filters.append("errored")
+        if pol.remove_low_ratio:
+            filters.append("seeding")
+        elif pol.remove_stalled:
+            filters.append("stalled_uploading")
         
-        # Clean old states
-        self._clean_old_states(torrents)
+        return self.client.get_torrents_matching(
+            filters=filters, categories=sorted(pol.auto_remove_set)
+        )
+    
+    def _count_states(self, states: Collection[str]) -> Dict:
+        """Count torrents per state group"""
+        stats = Counter(filter(None, map(STATE_BUCKET.get, states)))
+        stats["total"] = len(states)
+        return stats
     
     def _process_removals(self, to_remove: List[Dict]):
         """Process torrent removals"""
@@ -483,7 +856,7 @@ class TorrentJanitor:
         if not dry_run:
             # Try reannounce first
             self.client.reannounce(hashes)
-            time.sleep(2)
+            time.sleep(self.config["thresholds"].get("reannounce_wait", 0.5))
         
         # Delete torrents
         if self.client.delete_torrents(hashes, dry_run=dry_run):
@@ -500,8 +873,7 @@ class TorrentJanitor:
                 
                 # Clean state for removed torrents
                 for hash_val in hashes:
-                    if hash_val in self.torrent_states:
-                        del self.torrent_states[hash_val]
+                    self._forget_state(hash_val)
         else:
             logging.error("❌ Failed to remove torrents")
     
@@ -522,15 +894,15 @@ class TorrentJanitor:
                         f"{self.stats['space_freed'] / (1024**3):.2f} GB freed "
                         f"in {session_time:.1f} hours")
     
-    def _clean_old_states(self, current_torrents: List[Dict]):
+    def _clean_old_states(self, current_hashes: Set[str]):
         """Clean states for torrents no longer present"""
-        current_hashes = {t["hash"] for t in current_torrents}
-        old_states = [h for h in self.torrent_states if h not in current_hashes]
+        old_states = self.torrent_states.keys() - current_hashes
         
         for h in old_states:
-            del self.torrent_states[h]
+            self.torrent_states.pop(h, None)
         
         if old_states:
+            self._state_dirty = True
             logging.info(f"🧹 Cleaned {len(old_states)} obsolete state(s)")
     
     def run(self):
@@ -545,12 +917,6 @@ class TorrentJanitor:
             try:
                 self.clean_torrents()
                 
-                # Log rotation if needed
-                if self.log_file.exists():
-                    max_size = self.config.get("logging", {}).get("max_file_size_mb", 10) * 1024 * 1024
-                    if self.log_file.stat().st_size > max_size:
-                        self._rotate_log()
-                
             except KeyboardInterrupt:
                 logging.info("⛔ Shutdown requested by user")
                 break
@@ -559,25 +925,8 @@ class TorrentJanitor:
             
             logging.info(f"💤 Next check in {check_interval // 60} minutes")
             logging.info("=" * 60)
+            self._log_buffer.flush()
             time.sleep(check_interval)
-    
-    def _rotate_log(self):
-        """Rotate log file"""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup = self.log_file.parent / f"{self.log_file.stem}_{timestamp}.log"
-            self.log_file.rename(backup)
-            logging.info("📝 Log file rotated")
-            
-            # Clean old logs
-            max_files = self.config.get("logging", {}).get("max_files", 5)
-            log_files = sorted(self.log_file.parent.glob(f"{self.log_file.stem}_*.log"))
-            if len(log_files) > max_files:
-                for old_log in log_files[:-max_files]:
-                    old_log.unlink()
-                    logging.info(f"🗑️  Deleted old log: {old_log.name}")
-        except Exception as e:
-            logging.error(f"Log rotation error: {e}")
 
 def load_config(config_file: Optional[str] = None) -> Dict:
     """Load configuration from file or use defaults"""
@@ -588,7 +937,8 @@ def load_config(config_file: Optional[str] = None) -> Dict:
             "username": os.getenv("QB_USERNAME", "admin"),
             "password": os.getenv("QB_PASSWORD", "adminadmin"),
             "timeout": 30,
-            "verify_ssl": True
+            "verify_ssl": True,
+            "max_workers": 8
         },
         "thresholds": {
             "max_queue_time": 172800,      # 48 hours
@@ -599,7 +949,9 @@ def load_config(config_file: Optional[str] = None) -> Dict:
             "min_progress_protect": 5,      # Protect torrents > 5% progress
             "min_download_speed": 1024,     # 1 KB/s
             "min_seeds_required": 1,
-            "max_seed_time": 604800         # 7 days
+            "max_seed_time": 604800,        # 7 days
+            "use_server_filter": True,      # Let qBittorrent pre-filter torrents
+            "reannounce_wait": 0.5          # Seconds between reannounce and delete
         },
         "rules": {
             "remove_errors": True,
@@ -628,22 +980,26 @@ def load_config(config_file: Optional[str] = None) -> Dict:
             "work_dir": os.getenv("WORK_DIR", "/tmp/torrentjanitor"),
             "state_file": "torrent_states.json",
             "log_file": "torrentjanitor.log",
-            "stats_file": "statistics.json"
+            "stats_file": "statistics.json",
+            "cookie_file": "qb_cookies.json"
         }
     }
     
     # Try loading config from file
     if config_file and Path(config_file).exists():
         try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
+            with open(config_file, 'rb') as f:
+                file_config = orjson.loads(f.read())
                 # Deep merge configurations
                 def deep_merge(base, override):
-                    for key, value in override.items():
-                        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                            deep_merge(base[key], value)
-                        else:
-                            base[key] = value
+                    stack = [(base, override)]
+                    while stack:
+                        base_dict, override_dict = stack.pop()
+                        for key, value in override_dict.items():
+                            if isinstance(value, dict) and isinstance(base_dict.get(key), dict):
+                                stack.append((base_dict[key], value))
+                            else:
+                                base_dict[key] = value
                 deep_merge(default_config, file_config)
                 logging.info(f"✓ Configuration loaded from {config_file}")
         except Exception as e: